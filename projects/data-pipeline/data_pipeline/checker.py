@@ -1,61 +1,216 @@
 """Checker module to define data quality checks via in-memory gx"""
 
 import logging
+import os
 import sys
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Iterator, Mapping, get_args
 
 import great_expectations as gx
 import pandas as pd
 import polars as pl
+from great_expectations.core.expectation_configuration import ExpectationConfiguration
+from great_expectations.core.expectation_suite import ExpectationSuite
 from great_expectations.data_context import FileDataContext
-from pydantic import ValidationError
+from great_expectations.validator.validator import Validator
+from pydantic import BaseModel, TypeAdapter, ValidationError
 
 from data_pipeline.params import (
-    AnalyticsBaseTableExpectationsStorage,
-    CountriesExpectationsStorage,
-    CustomersExpectationsStorage,
     JsonLinesStorage,
-    OrdersExpectationsStorage,
-    ProductsExpectationsStorage,
-    SalesExpectationsStorage,
+    expectation_suites_storages,
+    json_files_type_adapters,
 )
 
 GX_DATA_CONTEXT_FOLDER = "tools/gx/data_context"
+GX_VALIDATORS_CACHE_SIZE = 32
+# Expectation types validated together, from the cheapest to the most expensive
+GX_VALIDATION_STAGES = (
+    ("expect_column_to_exist",),
+    ("expect_column_values_to_not_be_null", "expect_column_values_to_be_unique"),
+)
+POLARS_DATA_TYPES = {int: pl.Int64, float: pl.Float64, str: pl.Utf8, bool: pl.Boolean}
+# Expectations specs per data asset, specialized once from their storages as
+# (columns to exist and be not null, columns to be unique, columns lengths)
+EXPECTATIONS_SPECS = {
+    data_asset_name: (
+        expectations_storage.columns_to_exist_and_be_not_null,
+        expectations_storage.columns_to_be_unique,
+        tuple(
+            zip(
+                expectations_storage.columns_with_length_equal_to,
+                expectations_storage.lengths_checks,
+            )
+        ),
+    )
+    for expectations_storages in expectation_suites_storages.values()
+    for data_asset_name, expectations_storage in expectations_storages.items()
+}
+
+# Validators cached per (context, expectation suite, data source, data asset),
+# each one used by a single validation thread at a time through its own lock
+gx_validators_cache: OrderedDict = OrderedDict()
+gx_validators_locks: dict = {}
+gx_validators_lock = threading.Lock()
+
+# Expectation suites, and their validation stages, built once per suite name
+gx_expectation_suites: dict = {}
+gx_stage_expectation_suites: dict = {}
+
+# Type adapters cached per pydantic validator, starting from the ones built at
+# import time for JSON files, so that no core schema is built while checking
+type_adapters_cache: dict = dict(json_files_type_adapters)
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=32)
+def _create_polars_schema(json_file_validator: BaseModel) -> dict:
+    """
+    Creates the polars schema matching an input pydantic validator. Schemas
+    are cached per validator, as validators fields do not change at runtime
+
+    Args:
+        json_file_validator (BaseModel): pydantic validator for input JSON file lines
+
+    Returns:
+        polars_schema (dict): mapping between columns names and polars data types
+    """
+    polars_schema = {}
+
+    for column, field_info in json_file_validator.model_fields.items():
+        # Optional fields are annotated as Union[data_type, None]
+        data_types = get_args(field_info.annotation) or (field_info.annotation,)
+        polars_schema[column] = POLARS_DATA_TYPES[data_types[0]]
+
+    return polars_schema
+
+
+def _get_type_adapter(json_file_validator: BaseModel) -> TypeAdapter:
+    """
+    Gets the pydantic type adapter validating a list of JSON file lines against
+    an input pydantic validator. Type adapters are cached, so that their core
+    schema is only built once
+
+    Args:
+        json_file_validator (BaseModel): pydantic validator for input JSON file lines
+
+    Returns:
+        type_adapter (TypeAdapter): pydantic type adapter for a list of JSON file lines
+    """
+    if json_file_validator not in type_adapters_cache:
+        type_adapters_cache[json_file_validator] = TypeAdapter(
+            list[json_file_validator]
+        )
+
+    return type_adapters_cache[json_file_validator]
+
+
+def _validate_json_lines(
+    extracted_json_lines: list[dict], type_adapter: TypeAdapter
+) -> tuple[list[dict], list[dict]]:
+    """
+    Validates JSON lines all at once with a pydantic type adapter. When some
+    lines are broken, the remaining ones are validated again, so that valid
+    JSON lines are always returned with the values coerced by pydantic
+
+    Args:
+        extracted_json_lines (list[dict]): list of input JSON file lines
+        type_adapter (TypeAdapter): pydantic type adapter for a list of JSON lines
+
+    Returns:
+        validated_and_broken_json_lines (tuple[list[dict], list[dict]]): validated
+        JSON lines and broken JSON lines
+    """
+    try:
+        return type_adapter.validate_python(extracted_json_lines), []
+    except ValidationError as validation_error:
+        broken_json_lines_indexes = set()
+        for error in validation_error.errors():
+            # Errors are located by JSON line index first
+            broken_json_lines_indexes.add(error["loc"][0])
+            logger.info(
+                "Incorrect schema in JSON line %s: %s", error["loc"][0], error["msg"]
+            )
+
+    broken_json_lines = [
+        extracted_json_line
+        for json_line_index, extracted_json_line in enumerate(extracted_json_lines)
+        if json_line_index in broken_json_lines_indexes
+    ]
+    validated_json_lines = type_adapter.validate_python(
+        [
+            extracted_json_line
+            for json_line_index, extracted_json_line in enumerate(extracted_json_lines)
+            if json_line_index not in broken_json_lines_indexes
+        ]
+    )
+
+    return validated_json_lines, broken_json_lines
+
+
+def _create_valid_json_lines_flat_structure(
+    valid_json_lines: list[dict], polars_schema: dict
+) -> pl.LazyFrame:
+    """
+    Creates a polars Lazyframe from valid JSON lines, stored column by column
+    against the polars schema of their pydantic validator
+
+    Args:
+        valid_json_lines (list[dict]): list of valid JSON lines
+        polars_schema (dict): polars schema of valid JSON lines
+
+    Returns:
+        valid_json_lines_flat_structure (pl.LazyFrame): polars Lazyframe with
+        valid JSON lines
+    """
+    valid_json_lines_columns = {
+        column: [valid_json_line.get(column) for valid_json_line in valid_json_lines]
+        for column in polars_schema
+    }
+    valid_json_lines_flat_structure = pl.LazyFrame(
+        valid_json_lines_columns, schema=polars_schema
+    )
+
+    return valid_json_lines_flat_structure
+
+
 def check_json_lines(
     extracted_json_lines: list[dict],
     json_file_name: str,
-    json_files_validators: dict,
+    json_files_validators: Mapping,
 ) -> dict:
     """
-    Returns a dictionary with two polars Dataframe, one that includes valid
-    input JSON file lines, one that include broken input JSON file lines
+    Returns a dictionary with a polars Lazyframe that includes valid input
+    JSON file lines, and a polars Dataframe that include broken input JSON file
+    lines. JSON lines are validated all at once by a pydantic type adapter,
+    valid JSON lines are then stored column by column from their validated
+    values to build their polars Lazyframe, which is only materialized once
+    curated
 
     Args:
         extracted_json_lines (list[dict]): list of input JSON file lines
         json_file_name (str): input JSON file name
-        json_files_validators (dict): pydantic validators for input JSON file lines
+        json_files_validators (Mapping): pydantic validators for input JSON file lines
 
     Returns:
         valid_and_broken_json_lines (dict): dict with json lines that passed validation
-        and json lines that did not, each is a polars Dataframe
+        as a polars Lazyframe and json lines that did not as a polars Dataframe
     """
-    json_lines_storage = JsonLinesStorage()
+    json_file_validator = json_files_validators[json_file_name]
 
-    for extracted_json_line in extracted_json_lines:
-        try:
-            # Store valid JSON line
-            json_files_validators[json_file_name](**extracted_json_line)
-            json_lines_storage.valid_json_lines.append(extracted_json_line)
-        except ValidationError:
-            # Store broken JSON line
-            print("Incorrect schema in JSON line: ", ValidationError)
-            json_lines_storage.broken_json_lines.append(extracted_json_line)
+    valid_json_lines, broken_json_lines = _validate_json_lines(
+        extracted_json_lines, _get_type_adapter(json_file_validator)
+    )
+    json_lines_storage = JsonLinesStorage(broken_json_lines=broken_json_lines)
 
     valid_and_broken_json_lines = {
-        "valid_json_lines": pl.DataFrame(json_lines_storage.valid_json_lines),
+        "valid_json_lines": _create_valid_json_lines_flat_structure(
+            valid_json_lines, _create_polars_schema(json_file_validator)
+        ),
         "broken_json_lines": pl.DataFrame(json_lines_storage.broken_json_lines),
     }
     logger.info("Check completed.")
@@ -63,9 +218,11 @@ def check_json_lines(
     return valid_and_broken_json_lines
 
 
+@lru_cache(maxsize=1)
 def create_gx_filesystem_context() -> gx.DataContext:
     """
-    Create great_expectations FileSystem DataContext
+    Create great_expectations FileSystem DataContext. The context is created
+    once per process, later calls return the cached one
 
     Returns:
         context (gx.DataContext): great_expectations FileSystem DataContext
@@ -75,33 +232,159 @@ def create_gx_filesystem_context() -> gx.DataContext:
     return context
 
 
+def _create_gx_expectation_suite_name(
+    expectation_suite_name: str, data_asset_name: str
+) -> str:
+    """
+    Create the name of the great_expectations suite of an input data asset
+
+    Args:
+        expectation_suite_name (str): name of the expectation suite
+        data_asset_name (str): name of the data asset
+
+    Returns:
+        asset_expectation_suite_name (str): name of the data asset expectation suite
+    """
+    asset_expectation_suite_name = f"{expectation_suite_name}_{data_asset_name}"
+    return asset_expectation_suite_name
+
+
+def _create_gx_expectation_configurations(
+    expectations_storage: type,
+) -> list[ExpectationConfiguration]:
+    """
+    Create great_expectations expectation configurations for the expectations
+    of the input expectations storage. Lengths are not part of them, as they
+    are checked in Polars before reaching gx
+
+    Args:
+        expectations_storage (type): expectations storage
+
+    Returns:
+        expectation_configurations (list[ExpectationConfiguration]): expectation
+        configurations
+    """
+    expectation_configurations = []
+
+    for column in expectations_storage.columns_to_exist_and_be_not_null:
+        expectation_configurations.extend(
+            [
+                ExpectationConfiguration(
+                    expectation_type="expect_column_to_exist",
+                    kwargs={"column": column},
+                ),
+                ExpectationConfiguration(
+                    expectation_type="expect_column_values_to_not_be_null",
+                    kwargs={"column": column},
+                ),
+            ]
+        )
+
+    for column in expectations_storage.columns_to_be_unique:
+        expectation_configurations.append(
+            ExpectationConfiguration(
+                expectation_type="expect_column_values_to_be_unique",
+                kwargs={"column": column},
+            )
+        )
+
+    return expectation_configurations
+
+
+def _create_gx_stage_expectation_suites(
+    expectation_suite: ExpectationSuite,
+) -> tuple[ExpectationSuite, ...]:
+    """
+    Split an input great_expectations suite into one suite per validation
+    stage, from the cheapest expectations to the most expensive ones
+
+    Args:
+        expectation_suite (ExpectationSuite): great_expectations suite
+
+    Returns:
+        stage_expectation_suites (tuple[ExpectationSuite, ...]): great_expectations
+        suites per validation stage
+    """
+    stage_expectation_suites = tuple(
+        ExpectationSuite(
+            expectation_suite_name=expectation_suite.expectation_suite_name,
+            expectations=[
+                expectation_configuration
+                for expectation_configuration in expectation_suite.expectations
+                if expectation_configuration.expectation_type in expectation_types
+            ],
+        )
+        for expectation_types in GX_VALIDATION_STAGES
+    )
+
+    return stage_expectation_suites
+
+
 def create_gx_expectations_suites(
-    context: gx.DataContext, expectation_suites_names: str
+    context: gx.DataContext,
+    expectation_suites_names: dict,
+    suites_expectations_storages: dict,
 ) -> None:
     """
-    Create great_expectations suites for curated and clean data
+    Create great_expectations suites for curated and clean data, one per data
+    asset, with all their expectations. Suites are built once here, so that
+    validators only run them afterwards. Suites, and their validation stages,
+    are kept in memory only: they are rebuilt from the expectations storages
+    on every run, so they are not saved to the context expectations store
 
     Args:
         context (gx.DataContext): great_expectations FileSystem DataContext
-        expectation_suites_names (str): list of expectation suite names to create
+        expectation_suites_names (dict): expectation suite names to create
+        suites_expectations_storages (dict): expectations storages per data asset
+        for each expectation suite
     """
-
-    for expectation_suite_name in expectation_suites_names.values():
-        context.add_or_update_expectation_suite(expectation_suite_name)
+    for suite_type, expectation_suite_name in expectation_suites_names.items():
+        expectations_storages = suites_expectations_storages[suite_type]
+        for data_asset_name, expectations_storage in expectations_storages.items():
+            asset_expectation_suite_name = _create_gx_expectation_suite_name(
+                expectation_suite_name, data_asset_name
+            )
+            expectation_suite = ExpectationSuite(
+                expectation_suite_name=asset_expectation_suite_name,
+                data_context=context,
+                expectations=_create_gx_expectation_configurations(
+                    expectations_storage
+                ),
+            )
+            gx_expectation_suites[asset_expectation_suite_name] = expectation_suite
+            gx_stage_expectation_suites[
+                asset_expectation_suite_name
+            ] = _create_gx_stage_expectation_suites(expectation_suite)
 
 
 def create_gx_datasources(
     context: gx.DataContext, expectation_data_sources_names: str
-) -> None:
+) -> dict:
     """
-    Create great_expectations datasources for curated and clean data
+    Create great_expectations datasources for curated and clean data, only
+    for the ones that are not already stored in the context. Datasources are
+    returned so that validations use them without looking them up again
 
     Args:
         context (gx.DataContext): great_expectations FileSystem DataContext
         expectation_data_sources_names (str): list of data source names to create
+
+    Returns:
+        datasources (dict): great_expectations datasources per data source name
     """
+    datasources = {}
+    existing_data_sources_names = set(context.datasources)
+
     for expectation_data_source_name in expectation_data_sources_names:
-        context.sources.add_or_update_pandas(name=expectation_data_source_name)
+        if expectation_data_source_name in existing_data_sources_names:
+            datasource = context.get_datasource(expectation_data_source_name)
+        else:
+            datasource = context.sources.add_or_update_pandas(
+                name=expectation_data_source_name
+            )
+        datasources[expectation_data_source_name] = datasource
+
+    return datasources
 
 
 def _create_gx_batch_request(
@@ -119,7 +402,11 @@ def _create_gx_batch_request(
     Returns:
         batch_request (gx): great_expectations batch request
     """
-    data_asset = datasource.add_dataframe_asset(name=data_asset_name)
+    # Reuse the data asset when it is already registered in the datasource
+    if data_asset_name in datasource.get_asset_names():
+        data_asset = datasource.get_asset(data_asset_name)
+    else:
+        data_asset = datasource.add_dataframe_asset(name=data_asset_name)
     batch_request = data_asset.build_batch_request(dataframe=flat_structure)
     return batch_request
 
@@ -139,196 +426,216 @@ def _create_gx_validator(
     Returns:
         validator (gx): great_expectations validator
     """
-    validator = context.get_validator(
-        batch_request=batch_request,
-        expectation_suite_name=expectation_suite_name,
-    )
+    # Suites built at startup are reused instead of being loaded from the context
+    if expectation_suite_name in gx_expectation_suites:
+        validator = context.get_validator(
+            batch_request=batch_request,
+            expectation_suite=gx_expectation_suites[expectation_suite_name],
+        )
+    else:
+        validator = context.get_validator(
+            batch_request=batch_request,
+            expectation_suite_name=expectation_suite_name,
+        )
     return validator
 
 
-def _validate_gx_sales_curated_expectations(
-    validator: gx, expectations_storage: SalesExpectationsStorage
-) -> gx:
-    """
-    Creates expectations for sales curated data against the input validator
-
-    Args:
-        validator (gx): great_expectations validator
-        expectations_storage (SalesExpectationsStorage): expectations storage
-
-    Returns:
-        validator_result (gx): expectations validation result
-    """
-    expectations_storage = SalesExpectationsStorage()
-
-    for column in expectations_storage.columns_to_exist_and_be_not_null:
-        validator.expect_column_to_exist(column)
-        validator.expect_column_values_to_not_be_null(column)
-
-    for column in expectations_storage.columns_to_be_unique:
-        validator.expect_column_values_to_be_unique(column)
-
-    validator_result = validator.validate()["success"]
-
-    return validator_result
-
-
-def _validate_gx_products_curated_expectations(
-    validator: gx, expectations_storage: ProductsExpectationsStorage
-) -> gx:
+@contextmanager
+def _get_gx_validator(
+    context: gx.DataContext,
+    datasource: gx,
+    data_asset_name: str,
+    expectation_suite_name: str,
+    flat_structure: pd.DataFrame,
+) -> Iterator[Validator]:
     """
-    Creates expectations for products curated data against the input
-    validator
+    Get a great_expectations validator for an input data asset and an input
+    expectation suite, with the input Pandas dataframe loaded as its batch.
+    Validators are cached with least recently used eviction, so on a cache hit
+    only the batch is replaced and the expectation suite is not loaded again.
+    The validator is locked until the context exits, so that its batch is not
+    replaced by another thread while it is being validated
 
     Args:
-        validator (gx): great_expectations validator
-        expectations_storage (ProductsExpectationsStorage): expectations storage
+        context (gx.DataContext): great_expectations FileSystem DataContext
+        datasource (gx): great_expectations datasource
+        data_asset_name (str): name of the data asset
+        expectation_suite_name (str): name of the expectation suite
+        flat_structure (pd.DataFrame): input Pandas dataframe
 
-    Returns:
-        validator_result (gx): expectations validation result
+    Yields:
+        validator (Validator): great_expectations validator
     """
-    expectations_storage = ProductsExpectationsStorage()
-
-    for column in expectations_storage.columns_to_exist_and_be_not_null:
-        validator.expect_column_to_exist(column)
-        validator.expect_column_values_to_not_be_null(column)
-
-    for column in expectations_storage.columns_to_be_unique:
-        validator.expect_column_values_to_be_unique(column)
-
-    for column in expectations_storage.columns_with_length_equal_to:
-        validator.expect_column_value_lengths_to_equal(column, 2)
-
-    validation_result = validator.validate()["success"]
-
-    return validation_result
-
+    cache_key = (
+        id(context),
+        expectation_suite_name,
+        datasource.name,
+        data_asset_name,
+    )
 
-def _validate_gx_orders_curated_expectations(
-    validator: gx, expectations_storage: OrdersExpectationsStorage
-) -> gx:
+    # Locks outlive evicted validators, so a cache key always maps to one lock
+    with gx_validators_lock:
+        validator_lock = gx_validators_locks.setdefault(cache_key, threading.Lock())
+
+    with validator_lock:
+        # The context and the cache are shared between validation threads
+        with gx_validators_lock:
+            batch_request = _create_gx_batch_request(
+                datasource, data_asset_name, flat_structure
+            )
+
+            if cache_key in gx_validators_cache:
+                gx_validators_cache.move_to_end(cache_key)
+                validator = gx_validators_cache[cache_key]
+                validator.load_batch_list(
+                    context.get_batch_list(batch_request=batch_request)
+                )
+            else:
+                validator = _create_gx_validator(
+                    context, batch_request, expectation_suite_name
+                )
+                gx_validators_cache[cache_key] = validator
+                if len(gx_validators_cache) > GX_VALIDATORS_CACHE_SIZE:
+                    gx_validators_cache.popitem(last=False)
+
+        yield validator
+
+
+def _check_columns_lengths(
+    flat_structure: pl.DataFrame, expectations_spec: tuple
+) -> bool:
     """
-    Creates expectations for orders curated data against the input
-    validator
+    Checks the lengths expectations of the input expectations spec against
+    the input Polars dataframe in a single select. Missing columns are left to
+    the existence expectations
 
     Args:
-        validator (gx): great_expectations validator
-        expectations_storage (OrdersExpectationsStorage): expectations storage
+        flat_structure (pl.DataFrame): input Polars dataframe
+        expectations_spec (tuple): expectations spec of the data asset
 
     Returns:
-        validator_result (gx): expectations validation result
+        lengths_check_result (bool): True if all lengths expectations are met
     """
-    expectations_storage = OrdersExpectationsStorage()
+    _, _, columns_lengths = expectations_spec
+    columns_lengths = [
+        (column, length)
+        for column, length in columns_lengths
+        if column in flat_structure.columns
+    ]
 
-    for column in expectations_storage.columns_to_exist_and_be_not_null:
-        validator.expect_column_to_exist(column)
-        validator.expect_column_values_to_not_be_null(column)
+    if not columns_lengths:
+        return True
 
-    for column in expectations_storage.columns_to_be_unique:
-        validator.expect_column_values_to_be_unique(column)
+    columns_with_wrong_lengths = flat_structure.select(
+        [
+            (pl.col(column).str.len_chars() != length).any().alias(column)
+            for column, length in columns_lengths
+        ]
+    ).row(0, named=True)
 
-    validator_result = validator.validate()["success"]
+    for column, has_wrong_lengths in columns_with_wrong_lengths.items():
+        if has_wrong_lengths:
+            logger.info("Column %s has values with unexpected lengths.", column)
 
-    return validator_result
+    return not any(columns_with_wrong_lengths.values())
 
 
-def _validate_gx_customers_curated_expectations(
-    validator: gx, expectations_storage: CustomersExpectationsStorage
-) -> gx:
+def _convert_to_pandas(
+    flat_structure: pl.DataFrame, expectations_spec: tuple
+) -> pd.DataFrame:
     """
-    Creates expectations for customers curated data against the input
-    validator
+    Converts the input Polars dataframe to an Arrow backed Pandas dataframe for
+    gx integration, with float NaN values as nulls. Only columns with existence,
+    not null or uniqueness expectations are converted, as lengths are checked
+    beforehand in Polars
 
     Args:
-        validator (gx): great_expectations validator
-        expectations_storage (CustomersExpectationsStorage): expectations storage
+        flat_structure (pl.DataFrame): input Polars dataframe
+        expectations_spec (tuple): expectations spec of the data asset
 
     Returns:
-        validator_result (gx): expectations validation result
+        flat_structure (pd.DataFrame): Arrow backed Pandas dataframe
     """
-    expectations_storage = CustomersExpectationsStorage()
-
-    for column in expectations_storage.columns_to_exist_and_be_not_null:
-        validator.expect_column_to_exist(column)
-        validator.expect_column_values_to_not_be_null(column)
-
-    for column in expectations_storage.columns_to_be_unique:
-        validator.expect_column_values_to_be_unique(column)
-
-    for column in expectations_storage.columns_with_length_equal_to:
-        validator.expect_column_value_lengths_to_equal(column, 2)
+    columns_to_exist_and_be_not_null, columns_to_be_unique, _ = expectations_spec
+    columns_with_expectations = set(columns_to_exist_and_be_not_null).union(
+        columns_to_be_unique
+    )
 
-    validator_result = validator.validate()["success"]
+    # Arrow backed NaN values are not missing values as NumPy backed ones were,
+    # so they are turned into nulls for not null expectations to catch them.
+    # Arrow buffers are wrapped rather than copied to NumPy where possible
+    flat_structure = (
+        flat_structure.select(
+            [
+                column
+                for column in flat_structure.columns
+                if column in columns_with_expectations
+            ]
+        )
+        .with_columns(pl.col(pl.Float32, pl.Float64).fill_nan(None))
+        .to_pandas(use_pyarrow_extension_array=True, zero_copy_only=False)
+    )
 
-    return validator_result
+    return flat_structure
 
 
-def _validate_gx_countries_curated_expectations(
-    validator: gx, expectations_storage: CountriesExpectationsStorage
-) -> gx:
+def _fast_precheck(
+    flat_structure: pd.DataFrame,
+    expectations_spec: tuple,
+) -> bool:
     """
-    Creates expectations for countries curated data against the input
-    validator
+    Checks the expectations of the input expectations spec directly against
+    the input Pandas dataframe, with one vectorized pass per kind of expectation.
+    Lengths are checked beforehand on the Polars dataframe
 
     Args:
-        validator (gx): great_expectations validator
-        expectations_storage (CountriesExpectationsStorage): expectations storage
+        flat_structure (pd.DataFrame): input Pandas dataframe
+        expectations_spec (tuple): expectations spec of the data asset
 
     Returns:
-        validator_result (gx): expectations validation result
+        precheck_result (bool): True if all expectations are met, False otherwise
     """
-    expectations_storage = CountriesExpectationsStorage()
-
-    for column in expectations_storage.columns_to_exist_and_be_not_null:
-        validator.expect_column_to_exist(column)
-        validator.expect_column_values_to_not_be_null(column)
+    columns_to_exist_and_be_not_null, columns_to_be_unique, _ = expectations_spec
 
-    for column in expectations_storage.columns_to_be_unique:
-        validator.expect_column_values_to_be_unique(column)
+    if not set(columns_to_exist_and_be_not_null).issubset(flat_structure.columns):
+        return False
 
-    for column, length in zip(
-        expectations_storage.columns_with_length_equal_to,
-        expectations_storage.lengths_checks,
-    ):
-        validator.expect_column_value_lengths_to_equal(column, length)
+    if not flat_structure[list(columns_to_exist_and_be_not_null)].notna().values.all():
+        return False
 
-    validator_result = validator.validate()["success"]
+    for column in columns_to_be_unique:
+        if flat_structure.duplicated(subset=column).any():
+            return False
 
-    return validator_result
+    return True
 
 
-def _validate_gx_analytics_base_table_clean_expectations(
-    validator: gx, expectations_storage: AnalyticsBaseTableExpectationsStorage
-) -> gx:
+def _validate_gx_expectations(validator: gx) -> bool:
     """
-    Creates expectations for analytics base table consumable data against the input
-    validator
+    Validates the expectations of the expectation suite of the input validator
+    stage by stage, from the cheapest expectations to the most expensive ones,
+    stopping at the first unsuccessful stage
 
     Args:
         validator (gx): great_expectations validator
-        expectations_storage (AnalyticsBaseTableExpectationsStorage): expectations storage
 
     Returns:
-        validator_result (gx): expectations validation result
+        validator_result (bool): expectations validation result
     """
-    expectations_storage = AnalyticsBaseTableExpectationsStorage()
-
-    for column in expectations_storage.columns_to_exist_and_be_not_null:
-        validator.expect_column_to_exist(column)
-        validator.expect_column_values_to_not_be_null(column)
-
-    for column in expectations_storage.columns_to_be_unique:
-        validator.expect_column_values_to_be_unique(column)
-
-    for column, length in zip(
-        expectations_storage.columns_with_length_equal_to,
-        expectations_storage.lengths_checks,
-    ):
-        validator.expect_column_value_lengths_to_equal(column, length)
+    stage_expectation_suites = gx_stage_expectation_suites.get(
+        validator.expectation_suite_name
+    )
+    # Suites not created in this run are split into stages from the validator
+    if stage_expectation_suites is None:
+        stage_expectation_suites = _create_gx_stage_expectation_suites(
+            validator.get_expectation_suite()
+        )
 
-    validator_result = validator.validate()["success"]
+    for stage_expectation_suite in stage_expectation_suites:
+        if not validator.validate(expectation_suite=stage_expectation_suite)["success"]:
+            return False
 
-    return validator_result
+    return True
 
 
 def validate_curated_flat_structure(
@@ -336,8 +643,8 @@ def validate_curated_flat_structure(
     context: gx.DataContext,
     json_file_name: str,
     expectation_suite_name: str,
-    data_source_name: str,
-) -> None:
+    datasource: gx,
+) -> bool:
     """
     Validates input expectation suite expectations against curated version of
     an input JSON file
@@ -347,91 +654,149 @@ def validate_curated_flat_structure(
         context (gx.DataContext): great_expectations FileSystem DataContext
         json_file_name (str): input JSON file name
         expectation_suite_name (str): input expectation suite name
-        data_source_name (str): input data source name
+        datasource (gx): input great_expectations datasource
+
+    Returns:
+        validation_results (bool): True if curated data matches expectations
     """
 
-    # Convert pl Dataframe to pd Dataframe for gx integration
-    flat_structure = flat_structure.to_pandas()
+    expectations_spec = EXPECTATIONS_SPECS[json_file_name]
 
-    batch_request = _create_gx_batch_request(
-        context.get_datasource(data_source_name), json_file_name, flat_structure
-    )
+    if not _check_columns_lengths(flat_structure, expectations_spec):
+        logger.info(
+            "Validation unsuccessful. %s curated data does not match expectations.",
+            json_file_name,
+        )
+        return False
 
-    validator = _create_gx_validator(context, batch_request, expectation_suite_name)
-
-    validation_specs = {
-        "sales": {
-            "expectations_storage": SalesExpectationsStorage,
-            "validator_function": _validate_gx_sales_curated_expectations,
-        },
-        "products": {
-            "expectations_storage": ProductsExpectationsStorage,
-            "validator_function": _validate_gx_products_curated_expectations,
-        },
-        "orders": {
-            "expectations_storage": OrdersExpectationsStorage,
-            "validator_function": _validate_gx_orders_curated_expectations,
-        },
-        "customers": {
-            "expectations_storage": CustomersExpectationsStorage,
-            "validator_function": _validate_gx_customers_curated_expectations,
-        },
-        "countries": {
-            "expectations_storage": CountriesExpectationsStorage,
-            "validator_function": _validate_gx_countries_curated_expectations,
-        },
-    }
+    flat_structure = _convert_to_pandas(flat_structure, expectations_spec)
 
-    if json_file_name in validation_specs:
-        validation_results = validation_specs[json_file_name]["validator_function"](
-            validator, validation_specs[json_file_name]["expectations_storage"]
-        )
+    # Only fall back to gx, and its reporting, when the precheck fails
+    if _fast_precheck(flat_structure, expectations_spec):
+        return True
+
+    with _get_gx_validator(
+        context=context,
+        datasource=datasource,
+        data_asset_name=json_file_name,
+        expectation_suite_name=_create_gx_expectation_suite_name(
+            expectation_suite_name, json_file_name
+        ),
+        flat_structure=flat_structure,
+    ) as validator:
+        validation_results = _validate_gx_expectations(validator)
 
     if not validation_results:
-        print(
-            f"""Validation unsuccessful. {json_file_name} curated data
-            does not match expectations. Stopping execution now."""
+        logger.info(
+            "Validation unsuccessful. %s curated data does not match expectations.",
+            json_file_name,
         )
+
+    return validation_results
+
+
+def validate_curated_flat_structures(
+    curated_flat_structures: dict,
+    context: gx.DataContext,
+    expectation_suite_name: str,
+    datasource: gx,
+) -> None:
+    """
+    Validates input expectation suite expectations against curated versions of
+    all input JSON files concurrently. Execution is stopped only once all
+    validations are completed, if any of them was unsuccessful
+
+    Args:
+        curated_flat_structures (dict): input Polars dataframes with curated data
+        per JSON file name
+        context (gx.DataContext): great_expectations FileSystem DataContext
+        expectation_suite_name (str): input expectation suite name
+        datasource (gx): input great_expectations datasource
+    """
+    with ThreadPoolExecutor(
+        max_workers=max(1, min(len(curated_flat_structures), os.cpu_count() or 1))
+    ) as executor:
+        validation_futures = [
+            executor.submit(
+                validate_curated_flat_structure,
+                flat_structure=flat_structure,
+                context=context,
+                json_file_name=json_file_name,
+                expectation_suite_name=expectation_suite_name,
+                datasource=datasource,
+            )
+            for json_file_name, flat_structure in curated_flat_structures.items()
+        ]
+        validation_results = [
+            validation_future.result()
+            for validation_future in as_completed(validation_futures)
+        ]
+
+    if not all(validation_results):
+        logger.info("Validation unsuccessful. Stopping execution now.")
         sys.exit()
 
+    logger.info("Validation completed.")
+
 
 def validate_consumable_flat_structure(
     flat_structure: pl.DataFrame,
     context: gx.DataContext,
     file_name: str,
     expectation_suite_name: str,
-    data_source_name: str,
-) -> None:
+    datasource: gx,
+) -> bool:
     """
-    Validates input expectation suite expectations against analytics base table
+    Validates input expectation suite expectations against analytics base table.
+    The result is returned rather than acted upon, so that the caller decides
+    whether execution is stopped
 
     Args:
         flat_structure (pl.DataFrame): input Polars dataframe with consumable data
         context (gx.DataContext): great_expectations FileSystem DataContext
-        json_file_name (str): consumable file name
+        file_name (str): consumable file name
         expectation_suite_name (str): input expectation suite name
-        data_source_name (str): input data source name
-    """
-
-    # Convert pl Dataframe to pd Dataframe for gx integration
-    flat_structure = flat_structure.to_pandas()
+        datasource (gx): input great_expectations datasource
 
-    batch_request = _create_gx_batch_request(
-        context.get_datasource(data_source_name), file_name, flat_structure
-    )
+    Returns:
+        validation_results (bool): True if consumable data matches expectations,
+        False if any expectation is not met
+    """
 
-    validator = _create_gx_validator(context, batch_request, expectation_suite_name)
+    expectations_spec = EXPECTATIONS_SPECS[file_name]
 
-    validation_results = _validate_gx_analytics_base_table_clean_expectations(
-        validator, AnalyticsBaseTableExpectationsStorage()
-    )
+    if not _check_columns_lengths(flat_structure, expectations_spec):
+        logger.info(
+            "Validation unsuccessful. %s consumable data does not match expectations.",
+            file_name,
+        )
+        return False
+
+    flat_structure = _convert_to_pandas(flat_structure, expectations_spec)
+
+    # Only fall back to gx, and its reporting, when the precheck fails
+    if _fast_precheck(flat_structure, expectations_spec):
+        logger.info("Validation completed.")
+        return True
+
+    with _get_gx_validator(
+        context=context,
+        datasource=datasource,
+        data_asset_name=file_name,
+        expectation_suite_name=_create_gx_expectation_suite_name(
+            expectation_suite_name, file_name
+        ),
+        flat_structure=flat_structure,
+    ) as validator:
+        validation_results = _validate_gx_expectations(validator)
 
     if not validation_results:
         logger.info(
-            """Validation unsuccessful. %s, consumable data
-            does not match expectations. Stopping execution now.""",
+            "Validation unsuccessful. %s consumable data does not match expectations.",
             file_name,
         )
-        sys.exit()
+        return False
 
     logger.info("Validation completed.")
+
+    return True
@@ -4,103 +4,86 @@ import logging
 from datetime import datetime
 
 import polars as pl
+import polars.selectors as cs
+
+# Values filling nulls per data type, other data types are left with nulls
+FILL_NULL_VALUES = {
+    pl.Int64: 0,
+    pl.Float64: 0.0,
+    pl.Utf8: "MISSING",
+    pl.Boolean: False,
+}
 
 logger = logging.getLogger(__name__)
 
 
-def _add_timestamp_column(flat_structure_to_curate: pl.DataFrame) -> pl.DataFrame:
+def _create_timestamp_expression(created_timestamp: datetime) -> pl.Expr:
     """
-    Add a timestamp column with the current date and time to the input
-    Polars dataframe
+    Create an expression adding a timestamp column with the input date and
+    time, broadcast as a single scalar to all rows
 
     Args:
-        flat_structure_to_curate (pl.DataFrame): Polars dataframe with raw data
+        created_timestamp (datetime): date and time of curation
 
     Returns:
-        flat_structure_to_curate (pl.DataFrame): Polars dataframe with timestamp column
+        timestamp_expression (pl.Expr): expression with timestamp column
     """
-    flat_structure_to_curate = flat_structure_to_curate.with_columns(
-        CreatedTimeStamp=datetime.now()
+    timestamp_expression = pl.lit(created_timestamp, dtype=pl.Datetime("us")).alias(
+        "CreatedTimeStamp"
     )
-    return flat_structure_to_curate
+    return timestamp_expression
 
 
-def _fill_nulls_in_columns(
-    flat_structure_to_curate: pl.DataFrame,
-) -> pl.DataFrame:
+def _create_fill_nulls_expressions() -> list[pl.Expr]:
     """
-    Fills nulls in columns in the input Polars dataframe. Columns with a non
+    Create expressions filling nulls in all columns of each data type with a
+    fill value, selecting columns by data type at once. Float columns are
+    rounded to 2 decimal places in the same expression. Columns with a non
     relevant or unknown data type are avoided
 
-    Args:
-        flat_structure_to_curate (pl.DataFrame): Polars dataframe with raw data
-
-    Returns:
-        flat_structure_to_curate (pl.DataFrame): Polars dataframe with nulls filled
-    """
-
-    fill_values = {
-        pl.Int64: 0,
-        pl.Float64: 0,
-        pl.Object: "MISSING",
-        pl.Boolean: False,
-    }
-
-    for column in flat_structure_to_curate.columns:
-        try:
-            fill_value = fill_values.get(flat_structure_to_curate[column].dtype)
-            flat_structure_to_curate = flat_structure_to_curate.with_columns(
-                pl.col(column).fill_null(fill_value)
-            )
-        # Avoid columns with a not relevant or unknown data type
-        except ValueError:
-            continue
-
-    return flat_structure_to_curate
-
-
-def _round_float_columns(flat_structure_to_curate: pl.DataFrame) -> pl.DataFrame:
-    """
-    Round float columns in the input Polars dataframe to 2 decimal places.
-
-    Args:
-        flat_structure_to_curate (pl.DataFrame): Polars dataframe with raw data
-
     Returns:
-        flat_structure_to_curate (pl.DataFrame): Polars dataframe with rounded float columns
+        fill_nulls_expressions (list[pl.Expr]): expressions with nulls filled
     """
-    for column in flat_structure_to_curate.columns:
-        if flat_structure_to_curate[column].dtype == pl.Float64:
-            flat_structure_to_curate = flat_structure_to_curate.with_columns(
-                flat_structure_to_curate[column].round(2)
-            )
+    fill_nulls_expressions = [
+        cs.by_dtype(data_type).fill_null(fill_value)
+        for data_type, fill_value in FILL_NULL_VALUES.items()
+        if data_type != pl.Float64
+    ]
+    # Floats are rounded once their nulls are filled
+    fill_nulls_expressions.append(
+        cs.by_dtype(pl.Float64).fill_null(FILL_NULL_VALUES[pl.Float64]).round(2)
+    )
 
-    return flat_structure_to_curate
+    return fill_nulls_expressions
 
 
 def create_curated_flat_structure(
-    flat_structure_to_curate: pl.DataFrame,
+    flat_structure_to_curate: pl.DataFrame | pl.LazyFrame,
+    created_timestamp: datetime,
 ) -> pl.DataFrame:
     """
-    Applies curation functions to the input Polars dataframe
+    Applies curation expressions to the input Polars dataframe in a single
+    lazy query, so that the dataframe is only materialized once. Duplicated
+    rows are dropped before adding the timestamp, which is then left out of
+    rows hashing. Lazy inputs, e.g. from Polars scans, are curated in streaming
+    mode and only materialized here, right before validation
 
     Args:
-        flat_structure_to_curate (pl.DataFrame): Polars dataframe with raw data
+        flat_structure_to_curate (pl.DataFrame | pl.LazyFrame): Polars dataframe
+        with raw data
+        created_timestamp (datetime): date and time of curation, shared by all
+        curated flat structures of a pipeline run
 
     Returns:
         curated_flat_structure (pl.DataFrame): Polars dataframe with curated data
     """
-
-    curating_functions = [
-        _add_timestamp_column,
-        _fill_nulls_in_columns,
-        _round_float_columns,
-    ]
-
-    for curating_function in curating_functions:
-        flat_structure_to_curate = curating_function(flat_structure_to_curate)
-
-    curated_flat_structure = getattr(flat_structure_to_curate, "unique")()
+    curated_flat_structure = (
+        flat_structure_to_curate.lazy()
+        .with_columns(*_create_fill_nulls_expressions())
+        .unique(maintain_order=False)
+        .with_columns(_create_timestamp_expression(created_timestamp))
+        .collect(streaming=True)
+    )
     logger.info("Curated flat structure created.")
 
     return curated_flat_structure
@@ -1,33 +1,64 @@
 """Extractor module to extract data from raw json files"""
 
-import json
 import logging
 import re
+from functools import lru_cache
+from pathlib import Path
+from typing import Iterator
 
-from data_pipeline.params import JsonLinesStorage
+from pydantic_core import from_json
+
+from data_pipeline.params import DATA_ROOT_FOLDER
+
+RAW_DATA_FOLDER_PATH = Path(DATA_ROOT_FOLDER) / "raw_data"
+# Raw JSON files are read in 1 MiB chunks to reduce read calls
+JSON_FILE_BUFFER_SIZE = 1 << 20
+# Undesired characters in schema attributes, and characters following them
+UNDESIRED_CHARACTERS_PATTERN = re.compile(r"[ .()$%]")
+CAMEL_CASE_PATTERN = re.compile(r"(?<=_)([^_])")
 
 logger = logging.getLogger(__name__)
 
 
-def _remove_final_comma(json_line: dict) -> dict:
+def _remove_final_comma(json_line: bytes) -> dict:
     """
     Removes final comma from JSON file line if that comma exists
     otherwise return the JSON file line as is
 
     Args:
-        json_line (dict): input JSON file line with final comma
+        json_line (bytes): input JSON file line with final comma
 
     Returns:
         json_line (dict): input JSON file line without final comma
     """
-    if json_line[-2] == ",":
-        json_line = json.loads(json_line[:-2])
-    else:
-        json_line = json.loads(json_line)
+    json_line = from_json(json_line.rstrip(b",\r\n "))
 
     return json_line
 
 
+@lru_cache(maxsize=512)
+def _rename_key(key: str) -> str:
+    """
+    Removes undesired characters from a schema attribute of an input JSON
+    file line to allow for Pydantic validation. Renamed attributes are cached,
+    as the same few attributes are found in every JSON file line
+
+    Args:
+        key (str): schema attribute with blank spaces
+
+    Returns:
+        new_key (str): schema attribute without blank spaces
+    """
+    # Replace all undesired characters with _ to allow for regex
+    key = UNDESIRED_CHARACTERS_PATTERN.sub("_", key)
+    # Apply CamelCase naming and remove all _
+    new_key = CAMEL_CASE_PATTERN.sub(lambda match: match.group(1).upper(), key).replace(
+        "_", ""
+    )
+
+    return new_key
+
+
 def _rename_keys(json_line: dict) -> dict:
     """
     Removes undesired characters from schema attributes in an input JSON
@@ -39,50 +70,66 @@ def _rename_keys(json_line: dict) -> dict:
     Returns:
         renamed_json_line (dict): input JSON file line without blank spaces in any attribute
     """
-    undesired_characters = [" ", ".", "(", ")", "$", "%"]
-    renamed_json_line = {}
-
-    for key, value in json_line.items():
-        for character in key:
-            if character in undesired_characters:
-                # Replace all undesired characters with _ to allow for regex
-                key = key.replace(character, "_")
-        # Apply CamelCase naming and remove all _
-        new_key = re.sub(
-            r"(?<=_)([^_])", lambda match: match.group(1).upper(), key
-        ).replace("_", "")
-        renamed_json_line[new_key] = value
+    renamed_json_line = {_rename_key(key): value for key, value in json_line.items()}
 
     return renamed_json_line
 
 
-def extract_json_lines_from_json_file(json_file_name: str) -> list[dict]:
+def _create_json_file_path(json_file_name: str) -> Path:
     """
-    Extract data from a JSON file with one JSON object per line
+    Create the path of an input JSON file in the raw data folder
 
     Args:
         json_file_name (str): input JSON file name
 
     Returns:
-        extracted_json_lines (list[dict]): list of input JSON file clean lines
+        json_file_path (Path): input JSON file path
+    """
+    json_file_path = RAW_DATA_FOLDER_PATH / f"{json_file_name}.json"
+    return json_file_path
+
+
+def iter_json_lines_from_json_file(json_file_name: str) -> Iterator[dict]:
     """
-    json_lines_storage = JsonLinesStorage()
+    Lazily extract data from a JSON file with one JSON object per line, one
+    clean line at a time, so that callers can stream through the file
 
+    Args:
+        json_file_name (str): input JSON file name
+
+    Yields:
+        json_line (dict): input JSON file clean line
+    """
     cleaning_functions = [
         _remove_final_comma,
         _rename_keys,
     ]
 
+    with _create_json_file_path(json_file_name).open(
+        "rb", buffering=JSON_FILE_BUFFER_SIZE
+    ) as json_file:
+        for json_line in json_file:
+            for cleaning_function in cleaning_functions:
+                json_line = cleaning_function(json_line)
+            yield json_line
+
+
+def extract_json_lines_from_json_file(json_file_name: str) -> list[dict]:
+    """
+    Extract data from a JSON file with one JSON object per line
+
+    Args:
+        json_file_name (str): input JSON file name
+
+    Returns:
+        extracted_json_lines (list[dict]): list of input JSON file clean lines
+    """
+    extracted_json_lines = []
+
     try:
-        with open(
-            "data" + "/" + "raw_data" + "/" + json_file_name + ".json", encoding="utf-8"
-        ) as json_file:
-            for json_line in json_file:
-                for cleaning_function in cleaning_functions:
-                    json_line = cleaning_function(json_line)
-                json_lines_storage.extracted_json_lines.append(json_line)
+        extracted_json_lines = list(iter_json_lines_from_json_file(json_file_name))
         logger.info("Extraction completed.")
     except FileNotFoundError:
         logger.info("File not found.")
 
-    return json_lines_storage.extracted_json_lines
+    return extracted_json_lines
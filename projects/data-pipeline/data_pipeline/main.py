@@ -1,119 +1,220 @@
 """Main entry point for data pipeline"""
 import logging
 import logging.config
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import datetime
+from functools import lru_cache, partial
 
+import polars as pl
 import yaml
 
+from data_pipeline import settings
 from data_pipeline.checker import (
     check_json_lines,
     create_gx_datasources,
     create_gx_expectations_suites,
     create_gx_filesystem_context,
     validate_consumable_flat_structure,
-    validate_curated_flat_structure,
+    validate_curated_flat_structures,
 )
 from data_pipeline.curator import create_curated_flat_structure
 from data_pipeline.extractor import extract_json_lines_from_json_file
 from data_pipeline.params import (
     consumable_columns_to_select,
-    curated_flat_structures,
     currencies_to_select,
     data_source_names,
     expectation_suites_names,
+    expectation_suites_storages,
     json_files_names,
     json_files_validators,
 )
 from data_pipeline.profiler import write_data_profile_report
-from data_pipeline.reader import read_data_from_file
 from data_pipeline.transformer import create_consumable_flat_structure
-from data_pipeline.writer import write_data_to_file
+from data_pipeline.writer import (
+    create_output_file_path,
+    write_data_to_file,
+    write_data_to_files,
+)
 
 LOGGING_CONF_PATH = "../../tools/conf/logging.yaml"
 
-with open(LOGGING_CONF_PATH, "r", encoding="utf-8") as file:
-    config = yaml.safe_load(file)
-
-logging.config.dictConfig(config)
 logger = logging.getLogger(__name__)
 
-logger.info("Running data pipeline.")
 
+@lru_cache(maxsize=None)
+def _configure_logging() -> None:
+    """
+    Configures logging from the logging configuration file, only once per process
+    """
+    # LibYAML C loader when PyYAML is built with it, pure Python loader otherwise
+    yaml_loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    with open(LOGGING_CONF_PATH, "r", encoding="utf-8") as file:
+        config = yaml.load(file, Loader=yaml_loader)
 
-def main():
-    """Main entry point"""
+    logging.config.dictConfig(config)
 
-    # Initiate gx objects
-    context = create_gx_filesystem_context()
-    create_gx_expectations_suites(context, expectation_suites_names)
-    create_gx_datasources(context, data_source_names)
 
-    # ETL logic - one file cached in memory at a time
-    for json_file_name in json_files_names:
-        extracted_json_lines = extract_json_lines_from_json_file(
+def _create_curated_flat_structure_from_json_file(
+    json_file_name: str, created_timestamp: datetime, file_timestamp: int
+) -> pl.DataFrame:
+    """
+    Extracts and checks an input JSON file, quarantines its broken JSON lines
+    and curates its valid ones
+
+    Args:
+        json_file_name (str): input JSON file name
+        created_timestamp (datetime): date and time of curation
+        file_timestamp (int): nanoseconds timestamp of written files prefix
+
+    Returns:
+        curated_flat_structure (pl.DataFrame): Polars dataframe with curated data
+    """
+    # Extracted JSON lines are not kept, so they are released once checked
+    valid_and_broken_json_lines = check_json_lines(
+        extracted_json_lines=extract_json_lines_from_json_file(
             json_file_name=json_file_name
-        )
-        valid_and_broken_json_lines = check_json_lines(
-            extracted_json_lines=extracted_json_lines,
-            json_file_name=json_file_name,
-            json_files_validators=json_files_validators,
-        )
-        write_data_to_file(
-            flat_structure=valid_and_broken_json_lines["broken_json_lines"],
+        ),
+        json_file_name=json_file_name,
+        json_files_validators=json_files_validators,
+    )
+    write_data_to_file(
+        flat_structure=valid_and_broken_json_lines["broken_json_lines"],
+        output_path=create_output_file_path(
             folder_name="quarantine_data",
             file_name=json_file_name,
             file_type="csv",
-            write_method="write_csv",
-        )
-        curated_flat_structure = create_curated_flat_structure(
-            valid_and_broken_json_lines["valid_json_lines"]
-        )
-        validate_curated_flat_structure(
-            flat_structure=curated_flat_structure,
-            context=context,
-            json_file_name=json_file_name,
-            expectation_suite_name=expectation_suites_names["curated"],
-            data_source_name=data_source_names["curated"],
-        )
-        write_data_to_file(
-            flat_structure=curated_flat_structure,
-            folder_name="curated_data",
-            file_name=json_file_name,
-            file_type="parquet",
-            write_method="write_parquet",
-        )
-        write_data_profile_report(
-            flat_structure=curated_flat_structure, file_name=json_file_name
+            file_timestamp=file_timestamp,
+        ),
+        write_method="write_csv",
+    )
+    curated_flat_structure = create_curated_flat_structure(
+        valid_and_broken_json_lines["valid_json_lines"], created_timestamp
+    )
+
+    return curated_flat_structure
+
+
+def main():
+    """Main entry point"""
+    _configure_logging()
+    logger.info("Running data pipeline.")
+
+    # Initiate gx objects
+    context = create_gx_filesystem_context()
+    create_gx_expectations_suites(
+        context, expectation_suites_names, expectation_suites_storages
+    )
+    datasources = create_gx_datasources(context, data_source_names)
+
+    # Data profiles are side artifacts, so they are written in the background
+    # while the ETL carries on. A single worker is used as ydata-profiling plots
+    # through matplotlib global state
+    profiling_executor = ThreadPoolExecutor(max_workers=1)
+    profiling_futures = []
+
+    # ETL logic - JSON files are independent, so they are curated in parallel
+    # worker processes. Curated files are kept in a local dict to be validated
+    # together and transformed, only written to disk for archival. All rows of
+    # all curated files share the same timestamp, and all files written by the
+    # run share the same prefix
+    created_timestamp = datetime.now()
+    file_timestamp = time.time_ns()
+
+    # Workers are spawned rather than forked, as forking after polars thread
+    # pool has started can deadlock, and configure their own logging
+    with ProcessPoolExecutor(
+        max_workers=min(len(json_files_names), os.cpu_count() or 1),
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_configure_logging,
+    ) as executor:
+        curated_flat_structures: dict[str, pl.DataFrame] = dict(
+            zip(
+                json_files_names,
+                executor.map(
+                    partial(
+                        _create_curated_flat_structure_from_json_file,
+                        created_timestamp=created_timestamp,
+                        file_timestamp=file_timestamp,
+                    ),
+                    json_files_names,
+                ),
+            )
         )
 
+    validate_curated_flat_structures(
+        curated_flat_structures=curated_flat_structures,
+        context=context,
+        expectation_suite_name=expectation_suites_names["curated"],
+        datasource=datasources[data_source_names["curated"]],
+    )
+
     for json_file_name in json_files_names:
-        curated_flat_structures[json_file_name] = read_data_from_file(
-            folder_name="curated_data",
-            file_name=json_file_name,
-            file_type="parquet",
-            read_method="read_parquet",
+        profiling_futures.append(
+            profiling_executor.submit(
+                write_data_profile_report,
+                flat_structure=curated_flat_structures[json_file_name],
+                file_name=json_file_name,
+                minimal=settings.minimal_data_profiles,
+                file_timestamp=file_timestamp,
+            )
         )
+    write_data_to_files(
+        [
+            {
+                "flat_structure": curated_flat_structures[json_file_name],
+                "output_path": create_output_file_path(
+                    folder_name="curated_data",
+                    file_name=json_file_name,
+                    file_type="parquet",
+                    file_timestamp=file_timestamp,
+                ),
+                "write_method": "write_parquet",
+            }
+            for json_file_name in json_files_names
+        ]
+    )
 
     consumable_flat_structure = create_consumable_flat_structure(
         curated_flat_structures, consumable_columns_to_select, currencies_to_select
     )
-    validate_consumable_flat_structure(
+    if not validate_consumable_flat_structure(
         flat_structure=consumable_flat_structure,
         context=context,
         file_name="analytics_base_table",
         expectation_suite_name=expectation_suites_names["consumable"],
-        data_source_name=data_source_names["consumable"],
-    )
+        datasource=datasources[data_source_names["consumable"]],
+    ):
+        logger.info("Validation unsuccessful. Stopping execution now.")
+        sys.exit()
     write_data_to_file(
         flat_structure=consumable_flat_structure,
-        folder_name="consumable_data",
-        file_name="analytics_base_table",
-        file_type="parquet",
+        output_path=create_output_file_path(
+            folder_name="consumable_data",
+            file_name="analytics_base_table",
+            file_type="parquet",
+            file_timestamp=file_timestamp,
+        ),
         write_method="write_parquet",
     )
-    write_data_profile_report(
-        flat_structure=consumable_flat_structure, file_name="analytics_base_table"
+    profiling_futures.append(
+        profiling_executor.submit(
+            write_data_profile_report,
+            flat_structure=consumable_flat_structure,
+            file_name="analytics_base_table",
+            minimal=settings.minimal_data_profiles,
+            file_timestamp=file_timestamp,
+        )
     )
 
+    # Waits for data profiles, raising any profiling error
+    for profiling_future in profiling_futures:
+        profiling_future.result()
+    profiling_executor.shutdown()
+
 
 if __name__ == "__main__":
     main()
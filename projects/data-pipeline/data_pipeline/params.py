@@ -1,19 +1,21 @@
 """Params module to store data pipeline parameters objects"""
 
 from dataclasses import dataclass, field
-from typing import List, Optional
+from types import MappingProxyType
+from typing import Annotated, List, Optional, Tuple
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
+from typing_extensions import TypedDict
 
 DATA_ROOT_FOLDER = "data"
 
-json_files_names = [
+json_files_names = (
     "sales",
     "customers",
     "products",
     "orders",
     "countries",
-]
+)
 
 expectation_suites_names = {
     "curated": "curated_flat_structure_suite",
@@ -24,16 +26,7 @@ expectation_suites_names = {
 data_source_names = {"curated": "curated", "consumable": "consumable"}
 
 
-curated_flat_structures = {
-    "sales": None,
-    "products": None,
-    "orders": None,
-    "customers": None,
-    "countries": None,
-}
-
-
-consumable_columns_to_select = [
+consumable_columns_to_select = (
     "SaleId",
     "SaleOrderId",
     "SaleProductId",
@@ -72,7 +65,7 @@ consumable_columns_to_select = [
     "CountryQuantityOverTotalQuantityPercentage",
     "QuantityOverMainCountriesQuantityPercentage",
     "QuantityOverTotalCountryQuantityPercentage",
-]
+)
 
 
 class SalesSchema(BaseModel):
@@ -140,180 +133,208 @@ class CountriesSchema(BaseModel):
     Service: Optional[float]
 
 
-@dataclass
+@dataclass(slots=True)
 class JsonLinesStorage:
-    """General data storage for JSON files lines"""
-
-    extracted_json_lines: List[dict] = field(default_factory=lambda: [])
-    valid_json_lines: List[dict] = field(default_factory=lambda: [])
-    broken_json_lines: List[dict] = field(default_factory=lambda: [])
-
-
-json_files_validators = {
-    "sales": SalesSchema,
-    "products": ProductsSchema,
-    "orders": OrdersSchema,
-    "customers": CustomersSchema,
-    "countries": CountriesSchema,
+    """
+    General data storage for JSON files lines. Only broken JSON lines are kept as
+    lines, valid ones are stored column by column
+    """
+
+    broken_json_lines: List[dict] = field(default_factory=list)
+
+
+# Validators are shared by all checks, so they are exposed as a read-only mapping
+json_files_validators = MappingProxyType(
+    {
+        "sales": SalesSchema,
+        "products": ProductsSchema,
+        "orders": OrdersSchema,
+        "customers": CustomersSchema,
+        "countries": CountriesSchema,
+    }
+)
+
+# Type adapters validating all lines of a JSON file at once, per validator. Lines
+# are validated as typed dicts with the validator fields, so that no model
+# instance is created per line
+json_files_type_adapters = {
+    json_file_validator: TypeAdapter(
+        List[
+            TypedDict(
+                json_file_validator.__name__,
+                {
+                    column: Annotated[field_info.annotation, field_info]
+                    for column, field_info in json_file_validator.model_fields.items()
+                },
+            )
+        ]
+    )
+    for json_file_validator in json_files_validators.values()
 }
 
 
-@dataclass
+# Expectations storages are read-only namespaces, allocated once at import
+# pylint: disable=too-few-public-methods
 class SalesExpectationsStorage:
     """Storage for sales data expectations"""
 
-    columns_to_exist_and_be_not_null: List[str] = field(
-        default_factory=lambda: [
-            "SaleId",
-            "OrderId",
-            "ProductId",
-            "Quantity",
-            "CreatedTimeStamp",
-        ]
+    columns_to_exist_and_be_not_null: Tuple[str, ...] = (
+        "SaleId",
+        "OrderId",
+        "ProductId",
+        "Quantity",
+        "CreatedTimeStamp",
     )
-    columns_to_be_unique: List[str] = field(default_factory=lambda: ["SaleId"])
+    columns_to_be_unique: Tuple[str, ...] = ("SaleId",)
+    columns_with_length_equal_to: Tuple[str, ...] = ()
+    lengths_checks: Tuple[int, ...] = ()
 
 
-@dataclass
 class ProductsExpectationsStorage:
     """Storage for products data expectations"""
 
-    columns_to_exist_and_be_not_null: List[str] = field(
-        default_factory=lambda: [
-            "ProductId",
-            "Name",
-            "ManufacturedCountry",
-            "WeightGrams",
-            "CreatedTimeStamp",
-        ]
-    )
-    columns_to_be_unique: List[str] = field(
-        default_factory=lambda: ["ProductId", "Name"]
-    )
-    columns_with_length_equal_to: List[str] = field(
-        default_factory=lambda: ["ManufacturedCountry"]
+    columns_to_exist_and_be_not_null: Tuple[str, ...] = (
+        "ProductId",
+        "Name",
+        "ManufacturedCountry",
+        "WeightGrams",
+        "CreatedTimeStamp",
     )
+    columns_to_be_unique: Tuple[str, ...] = ("ProductId", "Name")
+    columns_with_length_equal_to: Tuple[str, ...] = ("ManufacturedCountry",)
+    lengths_checks: Tuple[int, ...] = (2,)
 
 
-@dataclass
 class OrdersExpectationsStorage:
     """Storage for orders data expectations"""
 
-    columns_to_exist_and_be_not_null: List[str] = field(
-        default_factory=lambda: ["OrderId", "CustomerId", "Date", "CreatedTimeStamp"]
+    columns_to_exist_and_be_not_null: Tuple[str, ...] = (
+        "OrderId",
+        "CustomerId",
+        "Date",
+        "CreatedTimeStamp",
     )
-    columns_to_be_unique: List[str] = field(default_factory=lambda: ["OrderId"])
+    columns_to_be_unique: Tuple[str, ...] = ("OrderId",)
+    columns_with_length_equal_to: Tuple[str, ...] = ()
+    lengths_checks: Tuple[int, ...] = ()
 
 
-@dataclass
 class CustomersExpectationsStorage:
     """Storage for customers data expectations"""
 
-    columns_to_exist_and_be_not_null: List[str] = field(
-        default_factory=lambda: [
-            "CustomerId",
-            "Active",
-            "Name",
-            "Address",
-            "City",
-            "Country",
-            "Email",
-            "CreatedTimeStamp",
-        ]
+    columns_to_exist_and_be_not_null: Tuple[str, ...] = (
+        "CustomerId",
+        "Active",
+        "Name",
+        "Address",
+        "City",
+        "Country",
+        "Email",
+        "CreatedTimeStamp",
     )
-    columns_to_be_unique: List[str] = field(default_factory=lambda: ["CustomerId"])
-    columns_with_length_equal_to: List[str] = field(default_factory=lambda: ["Country"])
+    columns_to_be_unique: Tuple[str, ...] = ("CustomerId",)
+    columns_with_length_equal_to: Tuple[str, ...] = ("Country",)
+    lengths_checks: Tuple[int, ...] = (2,)
 
 
-@dataclass
 class CountriesExpectationsStorage:
     """Storage for countries data expectations"""
 
-    columns_to_exist_and_be_not_null: List[str] = field(
-        default_factory=lambda: [
-            "Country",
-            "Currency",
-            "Name",
-            "Region",
-            "Population",
-            "AreaSqMi",
-            "PopDensityPerSqMi",
-            "CoastlineCoastPerAreaRatio",
-            "NetMigration",
-            "InfantMortalityPer1000Births",
-            "GDPPerCapita",
-            "Literacy",
-            "PhonesPer1000",
-            "Arable",
-            "Crops",
-            "Other",
-            "Climate",
-            "Birthrate",
-            "Deathrate",
-            "Agriculture",
-            "Industry",
-            "Service",
-            "CreatedTimeStamp",
-        ]
+    columns_to_exist_and_be_not_null: Tuple[str, ...] = (
+        "Country",
+        "Currency",
+        "Name",
+        "Region",
+        "Population",
+        "AreaSqMi",
+        "PopDensityPerSqMi",
+        "CoastlineCoastPerAreaRatio",
+        "NetMigration",
+        "InfantMortalityPer1000Births",
+        "GDPPerCapita",
+        "Literacy",
+        "PhonesPer1000",
+        "Arable",
+        "Crops",
+        "Other",
+        "Climate",
+        "Birthrate",
+        "Deathrate",
+        "Agriculture",
+        "Industry",
+        "Service",
+        "CreatedTimeStamp",
     )
-    columns_to_be_unique: List[str] = field(default_factory=lambda: ["Country"])
-    columns_with_length_equal_to: List[str] = field(
-        default_factory=lambda: ["Country", "Currency"]
-    )
-    lengths_checks: List[int] = field(default_factory=lambda: [2, 3])
+    columns_to_be_unique: Tuple[str, ...] = ("Country",)
+    columns_with_length_equal_to: Tuple[str, ...] = ("Country", "Currency")
+    lengths_checks: Tuple[int, ...] = (2, 3)
 
 
-@dataclass
 class AnalyticsBaseTableExpectationsStorage:
     """Storage for countries data expectations"""
 
-    columns_to_exist_and_be_not_null: List[str] = field(
-        default_factory=lambda: [
-            "SaleId",
-            "SaleOrderId",
-            "SaleProductId",
-            "ProductName",
-            "ProductManufacturedCountry",
-            "CustomerName",
-            "CustomerAddress",
-            "CustomerCity",
-            "CustomerCountry",
-            "CustomerEmail",
-            "CountryCurrency",
-            "CountryName",
-            "CountryRegion",
-            "OrderDate",
-            "CustomerActive",
-            "CountryPopulation",
-            "CountryAreaSqMi",
-            "CountryPopDensityPerSqMi",
-            "CountryCoastlineCoastPerAreaRatio",
-            "CountryNetMigration",
-            "CountryInfantMortalityPer1000Births",
-            "CountryGDPPerCapita",
-            "CountryLiteracy",
-            "CountryPhonesPer1000",
-            "CountryArable",
-            "CountryCrops",
-            "CountryClimate",
-            "CountryBirthrate",
-            "CountryDeathrate",
-            "CountryAgriculture",
-            "CountryIndustry",
-            "CountryService",
-            "ProductWeightGrams",
-            "SaleQuantity",
-            "ProductWeightGramsPerSaleQuantity",
-            "CountryQuantityOverTotalQuantityPercentage",
-            "QuantityOverMainCountriesQuantityPercentage",
-            "QuantityOverTotalCountryQuantityPercentage",
-        ]
+    columns_to_exist_and_be_not_null: Tuple[str, ...] = (
+        "SaleId",
+        "SaleOrderId",
+        "SaleProductId",
+        "ProductName",
+        "ProductManufacturedCountry",
+        "CustomerName",
+        "CustomerAddress",
+        "CustomerCity",
+        "CustomerCountry",
+        "CustomerEmail",
+        "CountryCurrency",
+        "CountryName",
+        "CountryRegion",
+        "OrderDate",
+        "CustomerActive",
+        "CountryPopulation",
+        "CountryAreaSqMi",
+        "CountryPopDensityPerSqMi",
+        "CountryCoastlineCoastPerAreaRatio",
+        "CountryNetMigration",
+        "CountryInfantMortalityPer1000Births",
+        "CountryGDPPerCapita",
+        "CountryLiteracy",
+        "CountryPhonesPer1000",
+        "CountryArable",
+        "CountryCrops",
+        "CountryClimate",
+        "CountryBirthrate",
+        "CountryDeathrate",
+        "CountryAgriculture",
+        "CountryIndustry",
+        "CountryService",
+        "ProductWeightGrams",
+        "SaleQuantity",
+        "ProductWeightGramsPerSaleQuantity",
+        "CountryQuantityOverTotalQuantityPercentage",
+        "QuantityOverMainCountriesQuantityPercentage",
+        "QuantityOverTotalCountryQuantityPercentage",
     )
-    columns_to_be_unique: List[str] = field(default_factory=lambda: ["SaleId"])
-    columns_with_length_equal_to: List[str] = field(
-        default_factory=lambda: ["CountryCurrency", "ProductManufacturedCountry"]
+    columns_to_be_unique: Tuple[str, ...] = ("SaleId",)
+    columns_with_length_equal_to: Tuple[str, ...] = (
+        "CountryCurrency",
+        "ProductManufacturedCountry",
     )
-    lengths_checks: List[int] = field(default_factory=lambda: [3, 2])
+    lengths_checks: Tuple[int, ...] = (3, 2)
+
+
+json_files_expectations_storages = {
+    "sales": SalesExpectationsStorage,
+    "products": ProductsExpectationsStorage,
+    "orders": OrdersExpectationsStorage,
+    "customers": CustomersExpectationsStorage,
+    "countries": CountriesExpectationsStorage,
+}
+
+
+expectation_suites_storages = {
+    "curated": json_files_expectations_storages,
+    "consumable": {"analytics_base_table": AnalyticsBaseTableExpectationsStorage},
+}
 
 
-currencies_to_select = ["USD", "GBP", "EUR"]
+# Currencies are only tested for membership
+currencies_to_select = frozenset({"USD", "GBP", "EUR"})
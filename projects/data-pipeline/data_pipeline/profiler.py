@@ -1,7 +1,7 @@
 """Profiler module to generate data profiles of curated and clean data"""
 
 import logging
-from datetime import datetime
+import time
 from pathlib import Path
 
 import polars as pl
@@ -12,21 +12,36 @@ from data_pipeline.params import DATA_ROOT_FOLDER
 logger = logging.getLogger(__name__)
 
 
-def write_data_profile_report(flat_structure: pl.DataFrame, file_name: str) -> None:
+def write_data_profile_report(
+    flat_structure: pl.DataFrame,
+    file_name: str,
+    minimal: bool = False,
+    file_timestamp: int | None = None,
+) -> None:
     """
-    Creates html data profiling report for an input polars dataframe
+    Creates html data profiling report for an input polars dataframe, prefixed
+    with an input timestamp or with the current one
 
     Args:
         flat_structure (pl.DataFrame): input polars dataframe
         file_name (str): output file name
+        minimal (bool): whether to skip the costly parts of the report, such as
+        correlations and interactions
+        file_timestamp (int | None): nanoseconds timestamp of file prefix, current
+        timestamp if None
     """
 
-    # Convert from polars to pandas dataframe for ydata-profiling integration
+    # Convert from polars to pandas dataframe for ydata-profiling integration,
+    # backed by numpy as ydata-profiling cannot describe pyarrow backed columns
     pd_flat_structure = flat_structure.to_pandas()
 
-    profile = ProfileReport(pd_flat_structure, title=f"Profile Report of {file_name}")
+    profile = ProfileReport(
+        pd_flat_structure, title=f"Profile Report of {file_name}", minimal=minimal
+    )
+    if file_timestamp is None:
+        file_timestamp = time.time_ns()
     output_path = Path(
-        f"{DATA_ROOT_FOLDER}/data_profiles/{str(datetime.now())}_{file_name}.html"
+        DATA_ROOT_FOLDER, "data_profiles", f"{file_timestamp:020d}_{file_name}.html"
     )
     profile.to_file(output_file=output_path)
     logger.info("Profiling completed.")
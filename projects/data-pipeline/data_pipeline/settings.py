@@ -1,4 +1,4 @@
-"""Settings for the Data Pipeline application - not yet in use"""
+"""Settings for the Data Pipeline application"""
 from pydantic_settings import BaseSettings
 
 
@@ -7,6 +7,8 @@ class Settings(BaseSettings):
     """Base settings object"""
 
     sample_setting: str = "Nicola Filosi"
+    # Data profiles can skip correlations and interactions when full ones are not needed
+    minimal_data_profiles: bool = False
 
     class Config:
         """Loads the env vars from a .env file"""
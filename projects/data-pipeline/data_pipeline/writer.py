@@ -1,33 +1,126 @@
 """Writer module to write data to physical files"""
 
 import logging
-from datetime import datetime
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 
 import polars as pl
 
 from data_pipeline.params import DATA_ROOT_FOLDER
 
+# Polars dataframe methods per write method, resolved once at import
+WRITE_METHODS = {
+    "write_parquet": pl.DataFrame.write_parquet,
+    "write_csv": pl.DataFrame.write_csv,
+}
+
+# Polars lazyframe methods per write method, streaming lazy queries to files
+# without materializing them in memory
+SINK_METHODS = {
+    "write_parquet": pl.LazyFrame.sink_parquet,
+    "write_csv": pl.LazyFrame.sink_csv,
+}
+
+# Parquet files are compressed and keep column statistics so that scans can skip
+# row groups, whether written or streamed
+PARQUET_OPTIONS = {
+    "compression": "zstd",
+    "compression_level": 3,
+    "statistics": True,
+    "row_group_size": 131072,
+}
+
+# Options per write method
+WRITE_METHODS_OPTIONS = {
+    "write_parquet": {"use_pyarrow": False, **PARQUET_OPTIONS},
+}
+
+# Options per sink method, csv files are streamed in larger batches of rows
+SINK_METHODS_OPTIONS = {
+    "write_parquet": PARQUET_OPTIONS,
+    "write_csv": {"include_header": True, "batch_size": 65536},
+}
+
 logger = logging.getLogger(__name__)
 
 
+def create_output_file_path(
+    folder_name: str, file_name: str, file_type: str, file_timestamp: int | None = None
+) -> Path:
+    """
+    Creates the path of a physical file to be written, prefixed with an input
+    timestamp, shared by all files of a pipeline run, or with the current one
+
+    Args:
+        folder_name (str): name of the folder where the file will be written
+        file_name (str): name of the file that will be written
+        file_type (str): type of file that will be written, either csv or parquet
+        file_timestamp (int | None): nanoseconds timestamp of file prefix, current
+        timestamp if None
+
+    Returns:
+        output_path (Path): path of the file that will be written
+    """
+    if file_timestamp is None:
+        file_timestamp = time.time_ns()
+    # Fixed width nanoseconds timestamp prefix, free of spaces and colons
+    output_path = Path(
+        DATA_ROOT_FOLDER, folder_name, f"{file_timestamp:020d}_{file_name}.{file_type}"
+    )
+
+    return output_path
+
+
 def write_data_to_file(
-    flat_structure: pl.DataFrame,
-    folder_name: str,
-    file_name: str,
-    file_type: str,
+    flat_structure: pl.DataFrame | pl.LazyFrame,
+    output_path: Path,
     write_method: str,
+    write_options: dict | None = None,
 ) -> None:
     """
     Writes a polars dataframe to a physical file, with the file type
-    being either csv or parquet
+    being either csv or parquet. Polars lazyframes are streamed to the file
+    instead of being collected first
 
     Args:
-        flat_structure (pd.DataFrame): pandas dataframe to be written to disk
-        folder_name (str): name of the folder where the file will be written
-        file_name (str): name of the file that will be written
-        file_type (str): type of file that will be written, either csv or parquet
+        flat_structure (pl.DataFrame | pl.LazyFrame): polars dataframe or lazyframe
+        to be written to disk
+        output_path (Path): path of the file that will be written, see
+        create_output_file_path
         write_method (str): method that will be used to write the data to a file
+        write_options (dict | None): options of the write method, overriding its
+        default ones
     """
-    output_path = f"{DATA_ROOT_FOLDER}/{folder_name}/{str(datetime.now())}_{file_name}.{file_type}"
+    if isinstance(flat_structure, pl.LazyFrame):
+        methods, methods_options = SINK_METHODS, SINK_METHODS_OPTIONS
+    else:
+        methods, methods_options = WRITE_METHODS, WRITE_METHODS_OPTIONS
     logger.info("File writing complete.")
-    return getattr(flat_structure, write_method)(output_path)
+    return methods[write_method](
+        flat_structure,
+        output_path,
+        **{**methods_options.get(write_method, {}), **(write_options or {})},
+    )
+
+
+def write_data_to_files(write_specs: list[dict]) -> None:
+    """
+    Writes polars dataframes to physical files concurrently, as polars releases
+    the GIL while writing so that file writes overlap
+
+    Args:
+        write_specs (list[dict]): keyword arguments of write_data_to_file, one dict
+        per file to be written
+    """
+    with ThreadPoolExecutor(
+        max_workers=max(1, min(len(write_specs), os.cpu_count() or 1))
+    ) as executor:
+        write_futures = [
+            executor.submit(write_data_to_file, **write_spec)
+            for write_spec in write_specs
+        ]
+        # Raises any writing error
+        for write_future in write_futures:
+            write_future.result()
@@ -0,0 +1,79 @@
+"""Tests for the checker module"""
+
+import polars as pl
+import pytest
+
+from data_pipeline.checker import (
+    EXPECTATIONS_SPECS,
+    _convert_to_pandas,
+    _fast_precheck,
+    check_json_lines,
+)
+from data_pipeline.params import CountriesSchema, json_files_validators
+
+
+def _create_countries_json_line(**values) -> dict:
+    """Creates a countries JSON line with null optional values"""
+    json_line = dict.fromkeys(CountriesSchema.model_fields)
+    json_line.update(Country="IT", Currency="EUR", Name="Italy", Region="Europe")
+    json_line.update(values)
+
+    return json_line
+
+
+def test_check_json_lines_keeps_values_coerced_by_pydantic():
+    """Lax values accepted by pydantic are kept with their coerced value"""
+    extracted_json_lines = [
+        _create_countries_json_line(Population=7.0, AreaSqMi=3),
+        _create_countries_json_line(Population="7", AreaSqMi="2.5"),
+    ]
+
+    valid_and_broken_json_lines = check_json_lines(
+        extracted_json_lines=extracted_json_lines,
+        json_file_name="countries",
+        json_files_validators=json_files_validators,
+    )
+    valid_json_lines = valid_and_broken_json_lines["valid_json_lines"].collect()
+
+    assert valid_json_lines["Population"].to_list() == [7, 7]
+    assert valid_json_lines["AreaSqMi"].to_list() == [3.0, 2.5]
+    assert valid_and_broken_json_lines["broken_json_lines"].is_empty()
+
+
+def test_check_json_lines_quarantines_broken_json_lines():
+    """Broken JSON lines are quarantined, valid ones keep their coerced value"""
+    extracted_json_lines = [
+        _create_countries_json_line(Population="7"),
+        _create_countries_json_line(Population="many"),
+    ]
+
+    valid_and_broken_json_lines = check_json_lines(
+        extracted_json_lines=extracted_json_lines,
+        json_file_name="countries",
+        json_files_validators=json_files_validators,
+    )
+    valid_json_lines = valid_and_broken_json_lines["valid_json_lines"].collect()
+    broken_json_lines = valid_and_broken_json_lines["broken_json_lines"]
+
+    assert valid_json_lines["Population"].to_list() == [7]
+    assert valid_json_lines.schema["Population"] == pl.Int64
+    assert broken_json_lines["Population"].to_list() == ["many"]
+
+
+@pytest.mark.parametrize(
+    "literacy, precheck_result", [(97.0, True), (float("nan"), False)]
+)
+def test_fast_precheck_treats_nan_as_null(literacy, precheck_result):
+    """Float NaN values fail not null expectations once converted to pandas"""
+    expectations_spec = EXPECTATIONS_SPECS["countries"]
+    columns_to_exist_and_be_not_null, _, _ = expectations_spec
+    flat_structure = pl.DataFrame(
+        {column: [1.0] for column in columns_to_exist_and_be_not_null}
+    ).with_columns(Literacy=pl.lit(literacy, dtype=pl.Float64))
+
+    assert (
+        _fast_precheck(
+            _convert_to_pandas(flat_structure, expectations_spec), expectations_spec
+        )
+        is precheck_result
+    )
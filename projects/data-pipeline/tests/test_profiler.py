@@ -0,0 +1,29 @@
+"""Tests for the profiler module"""
+
+from datetime import datetime
+
+import polars as pl
+
+from data_pipeline import profiler
+
+
+def test_write_data_profile_report_writes_html_report(tmp_path, monkeypatch):
+    """A full profile report is built and written for a curated like dataframe"""
+    monkeypatch.setattr(profiler, "DATA_ROOT_FOLDER", str(tmp_path))
+    (tmp_path / "data_profiles").mkdir()
+    # Enough distinct values for numeric columns not to be profiled as categorical
+    flat_structure = pl.DataFrame(
+        {
+            "Country": [f"C{index}" for index in range(49)] + [None],
+            "Population": list(range(50)),
+            "AreaSqMi": [index * 1.5 for index in range(49)] + [None],
+            "CreatedTimeStamp": [datetime(2024, 1, 1)] * 50,
+        }
+    )
+
+    profiler.write_data_profile_report(
+        flat_structure=flat_structure, file_name="countries", file_timestamp=1
+    )
+
+    output_path = tmp_path / "data_profiles" / f"{1:020d}_countries.html"
+    assert output_path.read_text(encoding="utf-8").startswith("<!doctype html>")